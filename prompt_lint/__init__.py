@@ -1,10 +1,13 @@
 from .models import Severity, LintIssue
-from .core import lint_prompt
+from .core import lint_prompt, lint_prompt_iter, lint_prompts, lint_prompts_iter
 from .rule_types import Rule
 from .config import LintConfig
 
 __all__ = [
     "lint_prompt",
+    "lint_prompt_iter",
+    "lint_prompts",
+    "lint_prompts_iter",
     "Severity",
     "LintIssue",
     "Rule",
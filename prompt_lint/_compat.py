@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# ``@dataclass(**DATACLASS_SLOTS)`` gives slotted dataclasses on Python 3.10+
+# and plain dataclasses on 3.9, where ``slots=`` is not supported.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def gil_enabled() -> bool:
+    """Return ``False`` only on a free-threaded build running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
@@ -0,0 +1,65 @@
+"""Per-rule memo of lint results, used by :func:`prompt_lint.core.lint_prompt`.
+
+The whole-call memo in :mod:`prompt_lint.core` misses as soon as any part of
+the config changes. This cache keeps each rule's issues for a prompt
+separately, so toggling or re-configuring one rule only re-runs that rule.
+
+Entries are keyed by a short digest of the prompt (so cached prompts are not
+kept alive) and by :attr:`PreparedRule.cache_key <prompt_lint.rule_types.PreparedRule.cache_key>`,
+which covers everything the rule's result depends on.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from .models import LintIssue
+
+
+def prompt_digest(prompt: str) -> bytes:
+    """Return a 16-byte digest identifying *prompt*."""
+    return hashlib.blake2b(
+        prompt.encode("utf8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+class RuleCache:
+    """Bounded LRU mapping ``(prompt digest, rule key)`` to a rule's issues.
+
+    Safe to share between threads: the lookups and LRU reordering of each
+    call happen under one lock.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Tuple[bytes, Hashable], Tuple[LintIssue, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, prompt_hash: bytes, rule_key: Hashable) -> Optional[Tuple[LintIssue, ...]]:
+        """Return the cached issues, or ``None`` if there is no entry."""
+        key = (prompt_hash, rule_key)
+        with self._lock:
+            issues = self._entries.get(key)
+            if issues is not None:
+                self._entries.move_to_end(key)
+        return issues
+
+    def set(self, prompt_hash: bytes, rule_key: Hashable, issues: Tuple[LintIssue, ...]) -> None:
+        """Store *issues*, evicting the least recently used entry if full."""
+        key = (prompt_hash, rule_key)
+        entries = self._entries
+        with self._lock:
+            entries[key] = issues
+            entries.move_to_end(key)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,192 @@
+"""Single-pass literal phrase matching shared by all phrase-based rules.
+
+Every literal phrase used by any active rule (``group_a``, ``group_b``,
+``phrases`` and ``needles`` options) is collected into one
+:class:`PhraseIndex`. The lowercased prompt is scanned once and the set of
+phrases found is handed to every rule, instead of each rule running its own
+``phrase in text`` loop.
+
+The scan uses the fastest available backend:
+
+1. ``hyperscan``: all phrases compiled into one SIMD-accelerated database;
+2. ``pyahocorasick``: a single Aho-Corasick pass;
+3. otherwise each *distinct* phrase is looked up once with
+   ``str.__contains__``, which is still faster than a pure-Python automaton
+   for prompt-sized inputs.
+
+All three already run the per-character work in C; what remains in Python is
+a handful of calls per prompt, not per character, so a compiled extension
+module for the scan would not pay for the build step it adds to this
+pure-Python package.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import hyperscan  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    hyperscan = None  # type: ignore[assignment]
+
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    ahocorasick = None  # type: ignore[assignment]
+
+#: Option keys whose values are lists of literal, case-insensitive phrases.
+PHRASE_OPTION_KEYS = ("group_a", "group_b", "phrases", "needles")
+
+
+def collect_phrases(
+    options: Mapping[str, Any],
+    keys: Iterable[str] = PHRASE_OPTION_KEYS,
+) -> Tuple[str, ...]:
+    """Return the lowercased literal phrases declared under *keys* in *options*."""
+    phrases: List[str] = []
+    for key in keys:
+        values = options.get(key)
+        if not values or isinstance(values, str):
+            continue
+        phrases.extend(v.lower() for v in values if isinstance(v, str))
+    return tuple(phrases)
+
+
+#: Scan backends, fastest first; ``"python"`` is always available.
+BACKENDS = ("hyperscan", "ahocorasick", "python")
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Return the names of the :data:`BACKENDS` usable in this environment."""
+    return tuple(
+        name
+        for name, module in zip(BACKENDS, (hyperscan, ahocorasick, True))
+        if module is not None
+    )
+
+
+def _hyperscan_literal(phrase: str) -> bytes:
+    """Encode *phrase* as a Hyperscan expression matching it literally."""
+    encoded = phrase.encode("utf8", "surrogatepass")
+    return "".join(f"\\x{b:02x}" for b in encoded).encode("ascii")
+
+
+class PhraseIndex:
+    """Multi-pattern matcher over a fixed set of lowercase phrases.
+
+    Each phrase is also assigned one bit, so a group of phrases can be
+    represented as an ``int`` mask (see :meth:`mask`) and tested against a
+    scan result with a single ``&``.
+
+    Indexes are shared (see :func:`get_phrase_index`) and safe to scan from
+    several threads at once. *backend* forces one of :data:`BACKENDS`
+    instead of the fastest available one.
+    """
+
+    def __init__(self, phrases: Iterable[str], backend: Optional[str] = None) -> None:
+        if backend is None:
+            backend = available_backends()[0]
+        elif backend not in available_backends():
+            raise ValueError(f"Phrase scan backend not available: {backend!r}")
+        self.phrases: FrozenSet[str] = frozenset(phrases)
+        self._database = None
+        self._automaton = None
+        # Hyperscan scratch space may only be used by one scan at a time, so
+        # each thread gets its own (see ``_scratch``).
+        self._local = threading.local()
+        # Neither backend can index the empty string; it trivially matches.
+        self._words = sorted(p for p in self.phrases if p)
+        self._bits: Dict[str, int] = {w: 1 << i for i, w in enumerate(self._words)}
+        self._empty_bit = 1 << len(self._words) if "" in self.phrases else 0
+        if self._empty_bit:
+            self._bits[""] = self._empty_bit
+        if not self._words:
+            return
+
+        if backend == "hyperscan":
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[_hyperscan_literal(w) for w in self._words],
+                ids=list(range(len(self._words))),
+                elements=len(self._words),
+                flags=hyperscan.HS_FLAG_SINGLEMATCH,
+            )
+            self._database = database
+        elif backend == "ahocorasick":
+            automaton = ahocorasick.Automaton()
+            for word in self._words:
+                automaton.add_word(word, (word, self._bits[word]))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def _scratch(self):
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+        return scratch
+
+    def mask(self, phrases: Iterable[str]) -> int:
+        """Return the bit mask of the indexed *phrases*; others are ignored."""
+        bits = self._bits
+        mask = 0
+        for phrase in phrases:
+            mask |= bits.get(phrase, 0)
+        return mask
+
+    def scan(self, text_lower: str) -> Tuple[FrozenSet[str], int]:
+        """Return the indexed phrases occurring in *text_lower*, and their mask."""
+        words = self._words
+        found = set()
+        found_mask = self._empty_bit
+
+        if self._database is not None:
+
+            def on_match(pattern_id, start, end, flags, context):
+                nonlocal found_mask
+                found.add(words[pattern_id])
+                found_mask |= 1 << pattern_id
+
+            # ``surrogatepass`` because a ``str`` may hold lone surrogates
+            # (e.g. from ``surrogateescape`` decoding), which plain UTF-8
+            # refuses to encode.
+            self._database.scan(
+                text_lower.encode("utf8", "surrogatepass"),
+                match_event_handler=on_match,
+                scratch=self._scratch(),
+            )
+        elif self._automaton is not None:
+            # The automaton reports every occurrence; once each phrase has
+            # been seen there is nothing left to learn from the rest of text.
+            remaining = len(words)
+            for _, (word, bit) in self._automaton.iter(text_lower):
+                if not found_mask & bit:
+                    found.add(word)
+                    found_mask |= bit
+                    remaining -= 1
+                    if not remaining:
+                        break
+        else:
+            # Deliberately ``str in str``: for ASCII prompts CPython already
+            # searches the compact 1-byte representation, and measured on
+            # 3.11 it is ~2x faster than ``bytes in bytes`` on pre-encoded text.
+            bits = self._bits
+            for word in words:
+                if word in text_lower:
+                    found.add(word)
+                    found_mask |= bits[word]
+
+        if self._empty_bit:
+            found.add("")
+        return frozenset(found), found_mask
+
+
+@lru_cache(maxsize=32)
+def get_phrase_index(phrases: FrozenSet[str]) -> PhraseIndex:
+    """Return a (cached) :class:`PhraseIndex` for *phrases*.
+
+    The cache is keyed by the phrase set itself, so config overrides simply
+    produce, and then reuse, a different index.
+    """
+    return PhraseIndex(phrases)
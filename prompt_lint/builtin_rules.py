@@ -1,82 +1,151 @@
 from __future__ import annotations
 
 import re
-from typing import Any, List, Mapping
+from typing import Any, Mapping, Optional, Sequence, Tuple
 
-from .models import LintIssue, Severity
-from .rule_types import Rule
+from .models import LintIssue, PromptContext, Severity
+from .rule_types import CompiledChecker, Rule
 
 
 # --- Generic rule primitives -------------------------------------------------
-
-
-def conflicting_keywords_checker(prompt: str, options: Mapping[str, Any]) -> List[LintIssue]:
-    text = prompt.lower()
-    group_a = [s.lower() for s in options.get("group_a", ())]
-    group_b = [s.lower() for s in options.get("group_b", ())]
-
-    found_a = [s for s in group_a if s in text]
-    found_b = [s for s in group_b if s in text]
-
-    if found_a and found_b:
-        msg = options.get(
-            "message",
+#
+# Each primitive is written as a ``compile_*`` function that resolves its
+# options once (lowercased needle tuples, message, rule id, severity) and
+# returns a ``(prompt, ctx) -> issues`` closure. ``Rule.prepare`` caches that
+# closure per options mapping; the ``*_checker`` functions are the plain
+# ``(prompt, options, ctx)`` form of the same logic.
+
+
+def _lowered(options: Mapping[str, Any], key: str) -> Tuple[str, ...]:
+    return tuple(s.lower() for s in options.get(key, ()))
+
+
+def compile_conflicting_keywords(
+    options: Mapping[str, Any],
+    severity: Optional[Severity] = None,
+) -> CompiledChecker:
+    group_a = _lowered(options, "group_a")
+    group_b = _lowered(options, "group_b")
+    message: Optional[str] = options.get("message")
+    rule_id = options.get("rule_id", "conflicting-keywords")
+    severity = severity or Severity.WARNING
+
+    def run(prompt: str, ctx: Optional[PromptContext] = None) -> Sequence[LintIssue]:
+        ctx = ctx or PromptContext(prompt)
+        found_a = [s for s in group_a if ctx.contains(s)]
+        if not found_a:
+            return ()
+        found_b = [s for s in group_b if ctx.contains(s)]
+        if not found_b:
+            return ()
+
+        msg = message if message is not None else (
             "Prompt contains conflicting instructions: "
-            f"{', '.join(found_a)} vs {', '.join(found_b)}.",
+            f"{', '.join(found_a)} vs {', '.join(found_b)}."
         )
-        return [
+        return (
             LintIssue(
-                rule_id=options.get("rule_id", "conflicting-keywords"),
-                severity=Severity.WARNING,
+                rule_id=rule_id,
+                severity=severity,
                 message=msg,
                 data={"group_a": found_a, "group_b": found_b},
-            )
-        ]
-    return []
+            ),
+        )
 
+    return run
 
-def phrase_match_checker(prompt: str, options: Mapping[str, Any]) -> List[LintIssue]:
-    text = prompt.lower()
-    phrases = [p.lower() for p in options.get("phrases", ())]
-    matches = [p for p in phrases if p in text]
-    if not matches:
-        return []
 
-    msg = options.get(
-        "message",
-        "Prompt contains discouraged phrases: " + ", ".join(matches),
-    )
-    return [
-        LintIssue(
-            rule_id=options.get("rule_id", "phrase-match"),
-            severity=Severity.WARNING,
-            message=msg,
-            data={"phrases": matches},
+def conflicting_keywords_checker(
+    prompt: str,
+    options: Mapping[str, Any],
+    ctx: Optional[PromptContext] = None,
+) -> Sequence[LintIssue]:
+    return compile_conflicting_keywords(options)(prompt, ctx)
+
+
+def compile_phrase_match(
+    options: Mapping[str, Any],
+    severity: Optional[Severity] = None,
+) -> CompiledChecker:
+    phrases = _lowered(options, "phrases")
+    message: Optional[str] = options.get("message")
+    rule_id = options.get("rule_id", "phrase-match")
+    severity = severity or Severity.WARNING
+
+    def run(prompt: str, ctx: Optional[PromptContext] = None) -> Sequence[LintIssue]:
+        ctx = ctx or PromptContext(prompt)
+        matches = [p for p in phrases if ctx.contains(p)]
+        if not matches:
+            return ()
+
+        msg = message if message is not None else (
+            "Prompt contains discouraged phrases: " + ", ".join(matches)
+        )
+        return (
+            LintIssue(
+                rule_id=rule_id,
+                severity=severity,
+                message=msg,
+                data={"phrases": matches},
+            ),
         )
-    ]
 
+    return run
 
-def must_contain_one_of_checker(prompt: str, options: Mapping[str, Any]) -> List[LintIssue]:
-    text = prompt.lower()
-    needles = [n.lower() for n in options.get("needles", ())]
-    if any(n in text for n in needles):
-        return []
 
+def phrase_match_checker(
+    prompt: str,
+    options: Mapping[str, Any],
+    ctx: Optional[PromptContext] = None,
+) -> Sequence[LintIssue]:
+    return compile_phrase_match(options)(prompt, ctx)
+
+
+def compile_must_contain_one_of(
+    options: Mapping[str, Any],
+    severity: Optional[Severity] = None,
+) -> CompiledChecker:
+    needles = _lowered(options, "needles")
     msg = options.get(
         "message",
         "Prompt does not contain any required pattern.",
     )
-    return [
-        LintIssue(
-            rule_id=options.get("rule_id", "missing-pattern"),
-            severity=Severity.INFO,
-            message=msg,
-            data={"needles": needles},
+    rule_id = options.get("rule_id", "missing-pattern")
+    severity = severity or Severity.INFO
+
+    def run(prompt: str, ctx: Optional[PromptContext] = None) -> Sequence[LintIssue]:
+        ctx = ctx or PromptContext(prompt)
+        if any(ctx.contains(n) for n in needles):
+            return ()
+
+        return (
+            LintIssue(
+                rule_id=rule_id,
+                severity=severity,
+                message=msg,
+                data={"needles": list(needles)},
+            ),
         )
-    ]
+
+    return run
+
+
+def must_contain_one_of_checker(
+    prompt: str,
+    options: Mapping[str, Any],
+    ctx: Optional[PromptContext] = None,
+) -> Sequence[LintIssue]:
+    return compile_must_contain_one_of(options)(prompt, ctx)
 
 
 # --- More specialised checkers used for built‑in rules -----------------------
+#
+# These patterns are flat word alternations between ``\b`` anchors, with no
+# nested or unbounded quantifiers, so ``re`` matches them in linear time and
+# they carry no ReDoS risk. ``re`` is also the faster engine for them: with
+# ``google-re2``, ``findall``/``finditer`` measured ~10x slower because of
+# per-match wrapper overhead. Literal phrase lists never reach a regex at
+# all; they go through the shared scan in ``_scanner``.
 
 TASK_VERB_RE = re.compile(
     r"\b("
@@ -93,67 +162,146 @@ ROLE_HINT_RE = re.compile(
     re.IGNORECASE,
 )
 
+ALSO_RE = re.compile(r"\balso\b", re.IGNORECASE)
+
+# Case-sensitive twins of the patterns above, matched against the already
+# lowercased ``ctx.text_lower``. Without ``re.IGNORECASE`` the regex engine
+# skips per-character case folding, which is ~2-3x faster on long prompts.
+# This is only equivalent for ASCII prompts: ``str.lower`` and the regex
+# engine's case folding disagree on characters such as "İ" and "ſ", so
+# non-ASCII prompts are matched with the IGNORECASE patterns instead.
+_TASK_VERB_LOWER_RE = re.compile(TASK_VERB_RE.pattern)
+_ALSO_LOWER_RE = re.compile(ALSO_RE.pattern)
+# Role hints and task verbs in one alternation, so ``missing-role`` needs a
+# single pass over the prompt.
+_ROLE_OR_TASK_LOWER_RE = re.compile(
+    rf"(?P<role>{ROLE_HINT_RE.pattern})|(?P<task>{TASK_VERB_RE.pattern})"
+)
+_ROLE_OR_TASK_RE = re.compile(_ROLE_OR_TASK_LOWER_RE.pattern, re.IGNORECASE)
+
+
+VAGUE_PHRASES = ("etc.", "etc", "and so on", "and so forth")
+
 
-def vague_objective_checker(prompt: str, options: Mapping[str, Any]) -> List[LintIssue]:
+def compile_vague_objective(
+    options: Mapping[str, Any],
+    severity: Optional[Severity] = None,
+) -> CompiledChecker:
     extended_options = dict(options)
     if "phrases" not in extended_options:
-        extended_options["phrases"] = [
-            "etc.",
-            "etc",
-            "and so on",
-            "and so forth",
-        ]
+        extended_options["phrases"] = list(VAGUE_PHRASES)
     extended_options.setdefault(
         "message",
         "Prompt ends with vague objectives such as 'etc.' or 'and so on'.",
     )
     extended_options.setdefault("rule_id", "vague-objective")
-    return phrase_match_checker(prompt, extended_options)
+    return compile_phrase_match(extended_options, severity)
 
 
-def multiple_tasks_checker(prompt: str, options: Mapping[str, Any]) -> List[LintIssue]:
-    max_tasks = int(options.get("max_tasks", 2))
-    verbs = TASK_VERB_RE.findall(prompt)
-    also_count = len(re.findall(r"\balso\b", prompt, flags=re.IGNORECASE))
-    estimated_tasks = len(verbs) + also_count
+def vague_objective_checker(
+    prompt: str,
+    options: Mapping[str, Any],
+    ctx: Optional[PromptContext] = None,
+) -> Sequence[LintIssue]:
+    return compile_vague_objective(options)(prompt, ctx)
 
-    if estimated_tasks <= max_tasks:
-        return []
 
+def compile_multiple_tasks(
+    options: Mapping[str, Any],
+    severity: Optional[Severity] = None,
+) -> CompiledChecker:
+    max_tasks = int(options.get("max_tasks", 2))
     msg = options.get(
         "message",
         "Prompt may contain multiple tasks; consider splitting it into smaller prompts.",
     )
-    return [
-        LintIssue(
-            rule_id=options.get("rule_id", "multiple-tasks"),
-            severity=Severity.INFO,
-            message=msg,
-            data={"estimated_tasks": estimated_tasks},
+    rule_id = options.get("rule_id", "multiple-tasks")
+    severity = severity or Severity.INFO
+
+    def run(prompt: str, ctx: Optional[PromptContext] = None) -> Sequence[LintIssue]:
+        ctx = ctx or PromptContext(prompt)
+        # ``len(findall())`` is the cheapest way to count matches here: on
+        # CPython 3.11 it beats both ``subn("", text)[1]`` (which builds a copy
+        # of the whole prompt) and counting ``finditer`` match objects.
+        if ctx.text.isascii():
+            text = ctx.text_lower
+            verbs = _TASK_VERB_LOWER_RE.findall(text)
+            # Cheap substring test before running the word-boundary regex.
+            also_count = len(_ALSO_LOWER_RE.findall(text)) if "also" in text else 0
+        else:
+            # No substring gate here: IGNORECASE also matches e.g. "ALſO",
+            # whose lowercase form does not contain "also".
+            verbs = TASK_VERB_RE.findall(ctx.text)
+            also_count = len(ALSO_RE.findall(ctx.text))
+        estimated_tasks = len(verbs) + also_count
+
+        if estimated_tasks <= max_tasks:
+            return ()
+
+        return (
+            LintIssue(
+                rule_id=rule_id,
+                severity=severity,
+                message=msg,
+                data={"estimated_tasks": estimated_tasks},
+            ),
         )
-    ]
+
+    return run
 
 
-def missing_role_checker(prompt: str, options: Mapping[str, Any]) -> List[LintIssue]:
-    if ROLE_HINT_RE.search(prompt):
-        return []
+def multiple_tasks_checker(
+    prompt: str,
+    options: Mapping[str, Any],
+    ctx: Optional[PromptContext] = None,
+) -> Sequence[LintIssue]:
+    return compile_multiple_tasks(options)(prompt, ctx)
 
-    # Only flag if there appear to be instructions.
-    if not TASK_VERB_RE.search(prompt):
-        return []
 
+def compile_missing_role(
+    options: Mapping[str, Any],
+    severity: Optional[Severity] = None,
+) -> CompiledChecker:
     msg = options.get(
         "message",
         "Consider defining a clear role/persona for the model "
         "(e.g. 'You are an expert data analyst.').",
     )
-    return [
-        LintIssue(
-            rule_id=options.get("rule_id", "missing-role"),
-            severity=Severity.INFO,
-            message=msg,
+    rule_id = options.get("rule_id", "missing-role")
+    severity = severity or Severity.INFO
+
+    def run(prompt: str, ctx: Optional[PromptContext] = None) -> Sequence[LintIssue]:
+        ctx = ctx or PromptContext(prompt)
+        # Only flag if there appear to be instructions and no role hint.
+        has_task = False
+        if ctx.text.isascii():
+            matches = _ROLE_OR_TASK_LOWER_RE.finditer(ctx.text_lower)
+        else:
+            matches = _ROLE_OR_TASK_RE.finditer(ctx.text)
+        for match in matches:
+            if match.group("role") is not None:
+                return ()
+            has_task = True
+        if not has_task:
+            return ()
+
+        return (
+            LintIssue(
+                rule_id=rule_id,
+                severity=severity,
+                message=msg,
+            ),
         )
-    ]
+
+    return run
+
+
+def missing_role_checker(
+    prompt: str,
+    options: Mapping[str, Any],
+    ctx: Optional[PromptContext] = None,
+) -> Sequence[LintIssue]:
+    return compile_missing_role(options)(prompt, ctx)
 
 
 # --- Concrete built‑in rules -------------------------------------------------
@@ -164,6 +312,7 @@ CONFLICTING_LENGTH_RULE = Rule(
     description="Detects conflicting length instructions like 'brief' and 'detailed'.",
     default_severity=Severity.WARNING,
     checker=conflicting_keywords_checker,
+    compiler=compile_conflicting_keywords,
     default_options={
         "rule_id": "conflicting-length",
         "group_a": ["brief", "short", "concise", "succinct"],
@@ -174,6 +323,7 @@ CONFLICTING_LENGTH_RULE = Rule(
         ),
     },
     tags={"length", "style"},
+    trigger_options=("group_a", "group_b"),
 )
 
 
@@ -182,6 +332,7 @@ UNBOUNDED_LENGTH_RULE = Rule(
     description="Flags phrases that suggest unbounded output length.",
     default_severity=Severity.WARNING,
     checker=phrase_match_checker,
+    compiler=compile_phrase_match,
     default_options={
         "rule_id": "unbounded-length",
         "phrases": [
@@ -197,6 +348,7 @@ UNBOUNDED_LENGTH_RULE = Rule(
         ),
     },
     tags={"length"},
+    trigger_options=("phrases",),
 )
 
 
@@ -205,6 +357,7 @@ NO_FORMAT_SPECIFIED_RULE = Rule(
     description="Warn when no explicit output format is given.",
     default_severity=Severity.INFO,
     checker=must_contain_one_of_checker,
+    compiler=compile_must_contain_one_of,
     default_options={
         "rule_id": "no-format-specified",
         "needles": [
@@ -231,10 +384,15 @@ VAGUE_OBJECTIVE_RULE = Rule(
     description="Warns on vague endings like 'etc.' or 'and so on'.",
     default_severity=Severity.INFO,
     checker=vague_objective_checker,
+    compiler=compile_vague_objective,
     default_options={
         "rule_id": "vague-objective",
+        # Listed here (not only in the checker) so the shared phrase scan
+        # picks them up.
+        "phrases": list(VAGUE_PHRASES),
     },
     tags={"style"},
+    trigger_options=("phrases",),
 )
 
 
@@ -243,6 +401,7 @@ MULTIPLE_TASKS_RULE = Rule(
     description="Heuristic for 'too many tasks in one prompt'.",
     default_severity=Severity.INFO,
     checker=multiple_tasks_checker,
+    compiler=compile_multiple_tasks,
     default_options={
         "rule_id": "multiple-tasks",
         "max_tasks": 2,
@@ -256,6 +415,9 @@ MISSING_ROLE_RULE = Rule(
     description="Suggests defining a clear role/persona for the model.",
     default_severity=Severity.INFO,
     checker=missing_role_checker,
+    compiler=compile_missing_role,
+    # Only fires on a task verb; the shortest are "list", "give" and "tell".
+    min_length=4,
     default_options={
         "rule_id": "missing-role",
     },
@@ -263,11 +425,17 @@ MISSING_ROLE_RULE = Rule(
 )
 
 
-BUILTIN_RULES = [
+BUILTIN_RULES: Tuple[Rule, ...] = (
     CONFLICTING_LENGTH_RULE,
     UNBOUNDED_LENGTH_RULE,
     NO_FORMAT_SPECIFIED_RULE,
     VAGUE_OBJECTIVE_RULE,
     MULTIPLE_TASKS_RULE,
     MISSING_ROLE_RULE,
-]
+)
+
+# Resolve the built-in rules for their default options at import time, so the
+# first ``lint_prompt`` call does not pay for it.
+for _rule in BUILTIN_RULES:
+    _rule.prepare(_rule.default_options, _rule.default_severity)
+del _rule
@@ -3,21 +3,50 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+import textwrap
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List
 
 from .config import LintConfig, load_config
-from .core import lint_prompt
+from .core import lint_prompt_iter, lint_prompts, lint_prompts_iter
+from .models import SEVERITY_VALUES, LintIssue
+
+PROMPT_FILE_PATTERNS = ("*.txt", "*.md")
+
+
+def _format_issue(issue: LintIssue) -> str:
+    severity = SEVERITY_VALUES.get(issue.severity, issue.severity)
+    return f"[{severity.upper()}] {issue.rule_id}: {issue.message}"
 
 
 def _read_prompt_from_file(path: str) -> str:
     return Path(path).read_text(encoding="utf8")
 
 
+def _find_prompt_files(directory: str) -> List[Path]:
+    root = Path(directory)
+    files = {p for pattern in PROMPT_FILE_PATTERNS for p in root.rglob(pattern) if p.is_file()}
+    return sorted(files)
+
+
 def _read_prompt_from_stdin() -> str:
     return sys.stdin.read()
 
 
+def _write_json_stream(records: Iterable[Dict[str, Any]]) -> None:
+    """Write *records* as an indented JSON array, one element at a time.
+
+    The output matches ``json.dump(list(records), sys.stdout, indent=2)``
+    without materialising the list.
+    """
+    first = True
+    for record in records:
+        sys.stdout.write("[\n" if first else ",\n")
+        sys.stdout.write(textwrap.indent(json.dumps(record, indent=2), "  "))
+        first = False
+    sys.stdout.write("[]\n" if first else "\n]\n")
+
+
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Static linter for LLM prompt strings.",
@@ -27,6 +56,18 @@ def main(argv: List[str] | None = None) -> int:
         type=str,
         help="Path to a prompt text file. If omitted, reads from stdin.",
     )
+    parser.add_argument(
+        "--recursive",
+        type=str,
+        metavar="DIR",
+        help="Lint every *.txt and *.md file under DIR.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of worker processes to use with --recursive (default: 1).",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -45,7 +86,20 @@ def main(argv: List[str] | None = None) -> int:
 
     args = parser.parse_args(argv)
 
-    if args.file:
+    if args.file and args.recursive:
+        parser.error("--file and --recursive cannot be combined.")
+    if args.jobs is not None and not args.recursive:
+        parser.error("--jobs can only be used with --recursive.")
+    jobs = 1 if args.jobs is None else args.jobs
+    if jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
+    if args.recursive:
+        if not Path(args.recursive).is_dir():
+            parser.error(f"--recursive: {args.recursive} is not a directory.")
+        paths = _find_prompt_files(args.recursive)
+        prompts = (_read_prompt_from_file(str(p)) for p in paths)
+    elif args.file:
         prompt = _read_prompt_from_file(args.file)
     else:
         if sys.stdin.isatty():
@@ -62,19 +116,44 @@ def main(argv: List[str] | None = None) -> int:
         cfg = None
         load_from_disk = True
 
-    issues = lint_prompt(
+    if args.recursive:
+        if jobs > 1:
+            results: Iterable[List[LintIssue]] = lint_prompts(
+                prompts,
+                config=cfg,
+                load_config_from_disk=load_from_disk,
+                jobs=jobs,
+            )
+        else:
+            # Lint file by file so memory stays flat regardless of corpus size.
+            results = lint_prompts_iter(
+                prompts,
+                config=cfg,
+                load_config_from_disk=load_from_disk,
+            )
+        if args.json:
+            _write_json_stream(
+                {"file": str(path), **issue.as_dict()}
+                for path, file_issues in zip(paths, results)
+                for issue in file_issues
+            )
+        else:
+            for path, file_issues in zip(paths, results):
+                for issue in file_issues:
+                    print(f"{path}: {_format_issue(issue)}")
+        return 0
+
+    issues = lint_prompt_iter(
         prompt,
         config=cfg,
         load_config_from_disk=load_from_disk,
     )
 
     if args.json:
-        payload = [issue.as_dict() for issue in issues]
-        json.dump(payload, sys.stdout, indent=2)
-        sys.stdout.write("\n")
+        _write_json_stream(issue.as_dict() for issue in issues)
     else:
         for issue in issues:
-            print(f"[{issue.severity.value.upper()}] {issue.rule_id}: {issue.message}")
+            print(_format_issue(issue))
 
     return 0
 
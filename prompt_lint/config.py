@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
 
-from .models import Severity
+from ._compat import DATACLASS_SLOTS
+from .models import SEVERITY_VALUES, Severity
 
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
@@ -15,33 +20,121 @@ except ModuleNotFoundError:  # pragma: no cover
         tomllib = None  # type: ignore[assignment]
 
 
-@dataclass
+_EMPTY_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
+
+def freeze_options(value: Any) -> Hashable:
+    """Return a hashable equivalent of a TOML-style option *value*.
+
+    Mappings become sorted item tuples and lists become tuples, recursively.
+    Values that are neither are returned as-is, so hashing the result can
+    still raise :class:`TypeError`.
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, freeze_options(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_options(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_options(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RuleOptions:
-    """Per‑rule configuration loaded from ``prompt-lint.toml``."""
+    """Per‑rule configuration loaded from ``prompt-lint.toml``.
+
+    Frozen, because parsed configs are cached and shared between callers.
+    """
 
     enabled: bool = True
     severity: Optional[Severity] = None
-    options: Mapping[str, Any] = field(default_factory=dict)
+    options: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_OPTIONS)
 
+    def __reduce__(self):
+        # The shared default ``options`` is a ``MappingProxyType``, which
+        # cannot be pickled (e.g. for ``lint_prompts`` worker processes).
+        return (self.__class__, (self.enabled, self.severity, dict(self.options)))
 
-@dataclass
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """Return a hashable value that is equal for equal rule options."""
+        # ``severity`` may be a plain string such as ``"error"``; Severity is a
+        # str enum, so both spellings look up the same value.
+        severity: Optional[str] = self.severity
+        if severity is not None:
+            severity = SEVERITY_VALUES.get(severity, severity)
+        return (self.enabled, severity, freeze_options(self.options))
+
+
+# Shared result for rules that have no section in the config.
+_DEFAULT_RULE_OPTIONS = RuleOptions()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LintConfig:
     """In‑memory representation of the config file."""
 
     rules: Mapping[str, RuleOptions] = field(default_factory=dict)
 
     def get_rule_options(self, rule_id: str) -> RuleOptions:
-        return self.rules.get(rule_id, RuleOptions())
+        """Return the options for *rule_id*.
 
+        Rules without a config section share one default instance, which
+        must not be modified.
+        """
+        return self.rules.get(rule_id, _DEFAULT_RULE_OPTIONS)
+
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """Return a hashable value that is equal for equivalent configs."""
+        return tuple(
+            sorted((rule_id, opts.fingerprint()) for rule_id, opts in self.rules.items())
+        )
 
-def _find_config_file(start: Optional[Path] = None) -> Optional[Path]:
-    """Walk upwards from *start* looking for ``prompt-lint.toml``."""
-    start = start or Path.cwd()
-    for path in (start, *start.parents):
-        candidate = path / "prompt-lint.toml"
-        if candidate.is_file():
-            return candidate
-    return None
+
+@lru_cache(maxsize=16)
+def _find_config_file_cached(start: str) -> Tuple[Optional[Path], Tuple[str, ...]]:
+    """Walk upwards from *start* looking for ``prompt-lint.toml``.
+
+    Memoised and keyed by the ``os.getcwd()`` string, which is much cheaper
+    to obtain and hash than a :class:`Path`. Also returns the candidate
+    paths that were checked and found missing, so callers can notice a
+    config file created since.
+    """
+    missing: List[str] = []
+    for path in (start, *map(str, Path(start).parents)):
+        candidate = os.path.join(path, "prompt-lint.toml")
+        if os.path.isfile(candidate):
+            return Path(candidate), tuple(missing)
+        missing.append(candidate)
+    return None, tuple(missing)
+
+
+def _discover_config_file(start: str) -> Optional[Path]:
+    """Return the config file for *start*, revalidating the cached result.
+
+    A cached result is recomputed if the file it found has been removed or
+    a ``prompt-lint.toml`` has appeared in one of the directories that
+    lacked one, so this costs a ``stat`` per directory searched.
+    """
+    cfg_path, missing = _find_config_file_cached(start)
+    if (cfg_path is not None and not cfg_path.is_file()) or any(
+        map(os.path.isfile, missing)
+    ):
+        _find_config_file_cached.cache_clear()
+        cfg_path = _find_config_file_cached(start)[0]
+    return cfg_path
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def clear_config_cache() -> None:
+    """Forget cached config discovery and parse results."""
+    _find_config_file_cached.cache_clear()
+    _load_config_cached.cache_clear()
 
 
 def _parse_severity(raw: str) -> Severity:
@@ -61,16 +154,31 @@ def load_config(path: str | Path | None = None) -> LintConfig:
     If *path* is ``None``, the file is discovered by walking up from the
     current working directory. If no file is found, an empty config is
     returned.
+
+    Discovery is cached per working directory and parsed configs are cached
+    by path and modification time, so repeated calls (e.g. from an editor
+    integration) only cost a ``stat`` per directory searched, and config
+    files created or removed since are still picked up. The returned config
+    is shared between such calls and should be treated as read-only; use
+    :func:`clear_config_cache` to drop the cached results.
     """
     if path is None:
-        cfg_path = _find_config_file()
-        if cfg_path is None:
+        cfg_path = _discover_config_file(os.getcwd())
+        mtime_ns = _mtime_ns(cfg_path) if cfg_path is not None else None
+        if cfg_path is None or mtime_ns is None:
             return LintConfig()
     else:
         cfg_path = Path(path)
         if not cfg_path.is_file():
             raise FileNotFoundError(cfg_path)
+        mtime_ns = cfg_path.stat().st_mtime_ns
+
+    return _load_config_cached(cfg_path.absolute(), mtime_ns)
+
 
+@lru_cache(maxsize=16)
+def _load_config_cached(cfg_path: Path, mtime_ns: int) -> LintConfig:
+    """Parse *cfg_path*; *mtime_ns* is only part of the cache key."""
     if tomllib is None:  # pragma: no cover - depends on environment
         raise RuntimeError(
             "Reading prompt-lint config requires Python 3.11+ or the 'tomli' "
@@ -96,7 +204,7 @@ def load_config(path: str | Path | None = None) -> LintConfig:
             for k, v in raw_opts.items()
             if k not in {"enabled", "severity"}
         }
-        rules[rule_id] = RuleOptions(
+        rules[sys.intern(rule_id)] = RuleOptions(
             enabled=enabled,
             severity=severity,
             options=options,
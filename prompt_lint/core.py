@@ -1,19 +1,40 @@
 from __future__ import annotations
 
-from typing import Callable, List, Mapping, Sequence, Union, Any
+import copy
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from ._compat import gil_enabled
+from ._rule_cache import RuleCache, prompt_digest
+from ._scanner import PhraseIndex, get_phrase_index
 from .config import LintConfig, load_config
-from .models import LintIssue, Severity
-from .rule_types import Rule, wrap_simple_rule
-from .rules_registry import get_all_rules
+from .models import LintIssue, PromptContext, Severity
+from .rule_types import CompiledChecker, PreparedRule, Rule, wrap_simple_rule
+from .rules_registry import get_default_rules
 
 SimpleRuleFn = Callable[[str], List[LintIssue]]
 RuleLike = Union[Rule, SimpleRuleFn]
+# (rule, compiled checker, effective severity, trigger phrase group bit
+# masks, per-rule result cache key or None)
+ActiveRule = Tuple[Rule, CompiledChecker, Severity, Tuple[int, ...], Optional[Hashable]]
 
 
-def _normalize_rules(rules: Sequence[RuleLike] | None) -> List[Rule]:
+def _normalize_rules(rules: Sequence[RuleLike] | None) -> Sequence[Rule]:
     if rules is None:
-        return get_all_rules()
+        return get_default_rules()
 
     normalised: List[Rule] = []
     for r in rules:
@@ -32,12 +53,241 @@ def _normalize_rules(rules: Sequence[RuleLike] | None) -> List[Rule]:
     return normalised
 
 
+def _resolve_config(config: LintConfig | None, load_config_from_disk: bool) -> LintConfig:
+    if config is not None:
+        return config
+    if load_config_from_disk:
+        return load_config()
+    return LintConfig()
+
+
+class _CacheKey:
+    """Hashable by *key* alone while carrying *value* along.
+
+    Used to pass rules and configs (which are not hashable) into this
+    module's ``lru_cache`` functions. The caches keep *value* alive, so an
+    ``id()``-based *key* cannot be reused by another object while its entry
+    exists.
+    """
+
+    __slots__ = ("key", "value", "_hash")
+
+    def __init__(self, key: Hashable, value: Any) -> None:
+        self.key = key
+        self.value = value
+        self._hash = hash(key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CacheKey) and self.key == other.key
+
+
+def _prepare(
+    rule_objs: Sequence[Rule],
+    config: LintConfig,
+) -> Tuple[Tuple[ActiveRule, ...], PhraseIndex]:
+    """Resolve enabled rules, their options and severity, and the phrase index.
+
+    This is the only place rules are matched to their config section, and
+    through :func:`_prepare_cached` it runs once per distinct rules and
+    config rather than once per prompt; the per-prompt loop in
+    :func:`_iter_rule_issues` never touches the config.
+    """
+    enabled: List[Tuple[Rule, PreparedRule, Severity]] = []
+    phrases: set[str] = set()
+
+    for rule in rule_objs:
+        opts = config.get_rule_options(rule.id)
+        if not opts.enabled:
+            continue
+
+        severity = opts.severity or rule.default_severity
+        prepared = rule.prepare(rule.merged_options(opts.options), severity)
+        phrases.update(prepared.phrases)
+        enabled.append((rule, prepared, severity))
+
+    index = get_phrase_index(frozenset(phrases))
+    active = tuple(
+        (
+            rule,
+            prepared.check,
+            severity,
+            tuple(index.mask(group) for group in prepared.triggers),
+            prepared.cache_key,
+        )
+        for rule, prepared, severity in enabled
+    )
+    return active, index
+
+
+def _cache_keys(
+    rules: Sequence[RuleLike] | None,
+    rule_objs: Sequence[Rule],
+    config: LintConfig,
+) -> Tuple[_CacheKey, _CacheKey] | None:
+    """Return hashable keys for *rule_objs* and *config*, or ``None``.
+
+    Legacy function rules are wrapped afresh on every call, some option
+    values cannot be hashed, and rules may opt out with ``cacheable=False``;
+    none of these can be cached. Rules are frozen, so their ids are a
+    sufficient key.
+    """
+    if rules is not None and not all(isinstance(r, Rule) for r in rules):
+        return None
+    if not all(r.cacheable for r in rule_objs):
+        return None
+    try:
+        config_key = _CacheKey(config.fingerprint(), config)
+    except TypeError:
+        return None
+    return _CacheKey(tuple(map(id, rule_objs)), tuple(rule_objs)), config_key
+
+
+# ``(default rules, cache keys)`` for an empty config, see ``_default_cache_keys``.
+_default_keys: Optional[Tuple[Sequence[Rule], Optional[Tuple[_CacheKey, _CacheKey]]]] = None
+
+
+def _default_cache_keys(rule_objs: Sequence[Rule]) -> Optional[Tuple[_CacheKey, _CacheKey]]:
+    """Return the cache keys for the default *rule_objs* and an empty config.
+
+    They only change when the default rule tuple itself is rediscovered.
+    """
+    global _default_keys
+    cached = _default_keys
+    if cached is None or cached[0] is not rule_objs:
+        cached = _default_keys = (rule_objs, _cache_keys(None, rule_objs, LintConfig()))
+    return cached[1]
+
+
+@lru_cache(maxsize=32)
+def _prepare_cached(
+    rules_key: _CacheKey,
+    config_key: _CacheKey,
+) -> Tuple[Tuple[ActiveRule, ...], PhraseIndex]:
+    return _prepare(rules_key.value, config_key.value)
+
+
+def _resolve(
+    rules: Sequence[RuleLike] | None,
+    config: LintConfig,
+) -> Tuple[Tuple[ActiveRule, ...], PhraseIndex]:
+    """:func:`_prepare` *rules* for *config*, reusing earlier results if possible."""
+    rule_objs = _normalize_rules(rules)
+    keys = _cache_keys(rules, rule_objs, config)
+    if keys is None:
+        return _prepare(rule_objs, config)
+    return _prepare_cached(*keys)
+
+
+def _iter_rule_issues(
+    prompt: str,
+    active: Iterable[ActiveRule],
+    index: PhraseIndex,
+    rule_cache: Optional[RuleCache] = None,
+) -> Iterator[Sequence[LintIssue]]:
+    """Run the *active* rules on *prompt*, yielding each non-empty result."""
+    # Lowercase once and scan once for the literal phrases of every active rule.
+    prompt_lower = prompt.lower()
+    found, found_mask = index.scan(prompt_lower)
+    ctx = PromptContext(
+        text=prompt,
+        text_lower=prompt_lower,
+        found=found,
+        searched=index.phrases,
+    )
+    digest = prompt_digest(prompt) if rule_cache is not None else b""
+
+    length = len(prompt)
+    issues: Optional[Sequence[LintIssue]]
+
+    for rule, compiled, severity, triggers, cache_key in active:
+        # Skip rules that cannot fire because a required phrase group is
+        # absent or the prompt is too short for them.
+        if triggers and not all(found_mask & group for group in triggers):
+            continue
+        if length < rule.min_length:
+            continue
+        if rule_cache is not None and cache_key is not None:
+            issues = rule_cache.get(digest, cache_key)
+            if issues is None:
+                issues = tuple(_stamp(compiled(prompt, ctx), rule, severity))
+                rule_cache.set(digest, cache_key, issues)
+        else:
+            issues = _stamp(compiled(prompt, ctx), rule, severity)
+        if issues:
+            yield issues
+
+
+def _stamp(
+    issues: Sequence[LintIssue],
+    rule: Rule,
+    severity: Severity,
+) -> Sequence[LintIssue]:
+    for issue in issues:
+        # Normalise severity and rule id in case the checker did not set
+        # them; built-in rules already build issues with both.
+        if issue.rule_id is not rule.id:
+            issue.rule_id = rule.id
+        if issue.severity is not severity:
+            issue.severity = severity
+    return issues
+
+
+def _collect_issues(
+    prompt: str,
+    active: Iterable[ActiveRule],
+    index: PhraseIndex,
+    rule_cache: Optional[RuleCache] = None,
+) -> List[LintIssue]:
+    issues: List[LintIssue] = []
+    for rule_issues in _iter_rule_issues(prompt, active, index, rule_cache):
+        issues.extend(rule_issues)
+    return issues
+
+
+# Per-rule results behind ``_lint_prompt_cached``, so a config change only
+# re-runs the rules it affects.
+_RULE_CACHE = RuleCache(maxsize=1024)
+
+
+@lru_cache(maxsize=512)
+def _lint_prompt_cached(
+    prompt: str,
+    rules_key: _CacheKey,
+    config_key: _CacheKey,
+) -> Tuple[LintIssue, ...]:
+    active, index = _prepare_cached(rules_key, config_key)
+    return tuple(_collect_issues(prompt, active, index, _RULE_CACHE))
+
+
+def _copy_issue(issue: LintIssue) -> LintIssue:
+    """Return a copy of a memoised *issue* that callers are free to modify.
+
+    ``copy.copy`` keeps :class:`LintIssue` subclasses and their extra fields;
+    ``data`` is then deep-copied so nested values are not shared either.
+    """
+    issue = copy.copy(issue)
+    if issue.data is not None:
+        issue.data = copy.deepcopy(issue.data)
+    return issue
+
+
+def clear_lint_cache() -> None:
+    """Forget the results and resolved rules memoised by :func:`lint_prompt`."""
+    _lint_prompt_cached.cache_clear()
+    _prepare_cached.cache_clear()
+    _RULE_CACHE.clear()
+
+
 def lint_prompt(
     prompt: str,
     rules: Sequence[RuleLike] | None = None,
     *,
     config: LintConfig | None = None,
     load_config_from_disk: bool = True,
+    cache: bool = True,
 ) -> List[LintIssue]:
     """Lint *prompt* and return a list of :class:`LintIssue` objects.
 
@@ -56,31 +306,125 @@ def lint_prompt(
     load_config_from_disk:
         If ``False``, skip automatic config discovery when *config* is
         ``None`` and use the default config instead.
+    cache:
+        If ``False``, run every rule afresh instead of using (or filling)
+        the memoised results described below.
+
+    Results are memoised per prompt, rule objects and config contents, so
+    re-linting unchanged text (e.g. from an editor on every keystroke) skips
+    all scanning. Each rule's issues are also cached per prompt, so after a
+    config change only the rules whose options, severity or ``version``
+    changed are re-run. Rules are therefore expected to be deterministic;
+    the returned issues are fresh copies, so modifying them does not affect
+    later calls. Legacy function rules and rules with ``cacheable=False``
+    are not memoised, and :func:`clear_lint_cache` empties the cache.
     """
     rule_objs = _normalize_rules(rules)
+    config = _resolve_config(config, load_config_from_disk)
 
-    if config is None:
-        if load_config_from_disk:
-            config = load_config()
-        else:
-            config = LintConfig()
+    keys: Optional[Tuple[_CacheKey, _CacheKey]]
+    if not cache:
+        keys = None
+    elif rules is None and not config.rules:
+        # The common ``lint_prompt(prompt)`` call with no config file: reuse
+        # keys for the default rules and config instead of rebuilding them.
+        keys = _default_cache_keys(rule_objs)
+    else:
+        keys = _cache_keys(rules, rule_objs, config)
+    if keys is None:
+        active, index = _prepare(rule_objs, config)
+        return _collect_issues(prompt, active, index)
+    return [_copy_issue(issue) for issue in _lint_prompt_cached(prompt, *keys)]
 
-    issues: List[LintIssue] = []
 
-    for rule in rule_objs:
-        opts = config.get_rule_options(rule.id)
-        if not opts.enabled:
-            continue
+def lint_prompt_iter(
+    prompt: str,
+    rules: Sequence[RuleLike] | None = None,
+    *,
+    config: LintConfig | None = None,
+    load_config_from_disk: bool = True,
+) -> Iterator[LintIssue]:
+    """Like :func:`lint_prompt`, but yield issues lazily as rules emit them.
 
-        merged_options: dict[str, Any] = dict(rule.default_options)
-        merged_options.update(opts.options)
+    Rules and config are resolved eagerly; rules run as the iterator is
+    consumed, so a consumer that stops early skips the remaining rules.
+    """
+    config = _resolve_config(config, load_config_from_disk)
+    active, index = _resolve(rules, config)
+    return chain.from_iterable(_iter_rule_issues(prompt, active, index))
 
-        severity = opts.severity or rule.default_severity
 
-        for issue in rule.checker(prompt, merged_options):
-            # Normalise severity and rule id in case the checker did not set them.
-            issue.rule_id = rule.id
-            issue.severity = severity
-            issues.append(issue)
+def lint_prompts_iter(
+    prompts: Iterable[str],
+    rules: Sequence[RuleLike] | None = None,
+    *,
+    config: LintConfig | None = None,
+    load_config_from_disk: bool = True,
+) -> Iterator[List[LintIssue]]:
+    """Lazily lint *prompts*, yielding one list of issues per prompt.
 
-    return issues
+    *prompts* is consumed one item at a time, so memory use does not grow
+    with the size of the batch.
+    """
+    config = _resolve_config(config, load_config_from_disk)
+    active, index = _resolve(rules, config)
+    for prompt in prompts:
+        yield _collect_issues(prompt, active, index)
+
+
+def _lint_shard(
+    prompts: List[str],
+    rules: Sequence[RuleLike] | None,
+    config: LintConfig,
+) -> List[List[LintIssue]]:
+    return list(lint_prompts_iter(prompts, rules, config=config))
+
+
+def _threads_run_in_parallel() -> bool:
+    """Whether threads can lint shards in parallel in this interpreter.
+
+    Rules are pure-Python, so without the GIL disabled threads would only
+    take turns.
+    """
+    return not gil_enabled()
+
+
+def lint_prompts(
+    prompts: Iterable[str],
+    rules: Sequence[RuleLike] | None = None,
+    *,
+    config: LintConfig | None = None,
+    load_config_from_disk: bool = True,
+    jobs: int = 1,
+) -> List[List[LintIssue]]:
+    """Lint many prompts, returning one list of issues per prompt.
+
+    Takes the same arguments as :func:`lint_prompt`. Rules, config and the
+    phrase index are resolved once for the whole batch rather than once per
+    prompt.
+
+    With ``jobs > 1`` the prompts are split into contiguous shards linted in
+    parallel. On a free-threaded Python running without the GIL the shards
+    run in threads; otherwise they run in separate processes, and *rules*
+    and *config* must then be picklable.
+    """
+    prompt_list = list(prompts)
+    config = _resolve_config(config, load_config_from_disk)
+
+    jobs = min(jobs, len(prompt_list))
+    if jobs <= 1:
+        return _lint_shard(prompt_list, rules, config)
+
+    size = -(-len(prompt_list) // jobs)
+    shards = [prompt_list[i : i + size] for i in range(0, len(prompt_list), size)]
+    results: List[List[LintIssue]] = []
+    executor: Executor
+    if _threads_run_in_parallel():
+        executor = ThreadPoolExecutor(max_workers=jobs)
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+    with executor:
+        futures = [executor.submit(_lint_shard, shard, rules, config) for shard in shards]
+        for future in futures:
+            results.extend(future.result())
+    return results
@@ -1,34 +1,113 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Literal, Optional, Tuple, Union
+
+from ._compat import DATACLASS_SLOTS
 
 
 class Severity(str, Enum):
     """Severity level for lint issues."""
 
+    # A ``str`` enum rather than an ``IntEnum``: the values are part of the
+    # JSON output and config format, and members compare equal to them.
+    # Equality and hashing already go through ``str``'s C implementations.
+
     INFO = "info"
     WARNING = "warning"
     ERROR = "error"
 
 
-@dataclass
+SeverityValue = Literal["info", "warning", "error"]
+
+# Plain-string severity values, to avoid ``Enum.value`` lookups on hot paths.
+# Keyed by the members, which as ``str`` subclasses also match plain strings.
+SEVERITY_VALUES: Dict[str, str] = {s: sys.intern(s.value) for s in Severity}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LintIssue:
-    """Represents a single lint issue emitted by a rule."""
+    """Represents a single lint issue emitted by a rule.
+
+    ``severity`` is normally a :class:`Severity`, but a plain severity string
+    (``"info"``, ``"warning"`` or ``"error"``) is accepted as well.
+
+    Not frozen: the linter fills in ``rule_id`` and ``severity`` on issues
+    from third-party checkers, and frozen dataclasses are ~3x slower to
+    construct on CPython.
+    """
 
     rule_id: str
     message: str
-    severity: Severity = Severity.WARNING
+    severity: Union[Severity, SeverityValue] = Severity.WARNING
     data: Optional[Dict[str, Any]] = None
 
     def as_dict(self) -> Dict[str, Any]:
         """Return a JSON‑serialisable representation of this issue."""
+        severity = self.severity
         result: Dict[str, Any] = {
             "ruleId": self.rule_id,
             "message": self.message,
-            "severity": self.severity.value,
+            "severity": severity.value if isinstance(severity, Severity) else severity,
         }
         if self.data:
             result["data"] = self.data
         return result
+
+
+@dataclass(**DATACLASS_SLOTS)
+class PromptContext:
+    """Per-prompt state computed once by :func:`lint_prompt` and shared by rules.
+
+    ``text_lower`` is the lowercased prompt, computed once instead of once
+    per rule. ``found`` holds the lowercase phrases that the shared phrase
+    scan located in the prompt, out of the ``searched`` phrases it looked for.
+
+    ``tokens`` is derived from the prompt on first use and then shared by
+    every rule that needs it; ``length_chars`` and ``length_words`` are cheap
+    counts that never tokenize.
+    """
+
+    text: str
+    text_lower: str = ""
+    found: FrozenSet[str] = frozenset()
+    searched: FrozenSet[str] = frozenset()
+    _tokens: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.text_lower:
+            self.text_lower = self.text.lower()
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """The lowercased prompt split on whitespace."""
+        tokens = self._tokens
+        if tokens is None:
+            tokens = self._tokens = tuple(self.text_lower.split())
+        return tokens
+
+    @property
+    def length_chars(self) -> int:
+        """Length of the prompt in characters."""
+        return len(self.text)
+
+    @property
+    def length_words(self) -> int:
+        """Approximate word count of the prompt (whitespace separators + 1).
+
+        Counts spaces, newlines and tabs, so runs of whitespace overcount.
+        Good enough for length heuristics and a few C-level scans, without
+        building a token list; use ``len(ctx.tokens)`` for an exact count.
+        """
+        text = self.text
+        if not text:
+            return 0
+        return text.count(" ") + text.count("\n") + text.count("\t") + 1
+
+    def contains(self, phrase: str) -> bool:
+        """Return whether lowercase *phrase* occurs in the prompt, ignoring case."""
+        if phrase in self.searched:
+            return phrase in self.found
+        return phrase in self.text_lower
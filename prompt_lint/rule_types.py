@@ -1,19 +1,112 @@
 from __future__ import annotations
 
+import inspect
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Callable, List, Mapping, Set
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
-from .models import LintIssue, Severity
+from ._compat import DATACLASS_SLOTS
+from ._scanner import PHRASE_OPTION_KEYS, collect_phrases
+from .config import freeze_options
+from .models import LintIssue, PromptContext, Severity
 
-CheckerFn = Callable[[str, Mapping[str, Any]], List[LintIssue]]
+# Checkers may return any sequence of issues; the built-in ones return tuples
+# (``()`` when nothing is found) to avoid allocating a list per rule.
+CheckerFn = Callable[[str, Mapping[str, Any], Optional[PromptContext]], Sequence[LintIssue]]
+CompiledChecker = Callable[[str, Optional[PromptContext]], Sequence[LintIssue]]
+# ``compiler(options)``, or ``compiler(options, severity=...)`` for compilers
+# that accept the effective severity.
+CompilerFn = Callable[..., CompiledChecker]
 
 
-@dataclass
+class PreparedRule(NamedTuple):
+    """Everything about a rule that depends only on its resolved options."""
+
+    check: CompiledChecker
+    #: Every literal phrase the rule's options declare under the standard
+    #: phrase-list keys or its ``trigger_options`` (lowercased).
+    phrases: Tuple[str, ...]
+    #: The phrases of each ``trigger_options`` group, in order.
+    triggers: Tuple[Tuple[str, ...], ...]
+    #: Hashable identity of the rule's behaviour for these options (id,
+    #: version, checker, compiler, severity, options), or ``None`` if the
+    #: options cannot be hashed. Results can be cached under this key.
+    cache_key: Optional[Hashable] = None
+
+
+def _accepts_context(fn: Callable[..., Any]) -> bool:
+    """Return ``True`` if *fn* can be called as ``fn(prompt, options, ctx=ctx)``.
+
+    The context is passed by keyword, so a legacy checker with some other
+    optional third parameter (``def checker(prompt, options, strict=False)``)
+    is not handed the context by mistake.
+    """
+    try:
+        inspect.signature(fn).bind(None, None, ctx=None)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _accepts_severity(fn: Optional[Callable[..., Any]]) -> bool:
+    """Return ``True`` if *fn* takes a ``severity`` argument."""
+    if fn is None:
+        return False
+    try:
+        return "severity" in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Rule:
     """A single lint rule with metadata and configuration.
 
     Rules are small checker functions plus some metadata (id, severity,
     default options, tags). They can be configured via ``prompt-lint.toml``.
+
+    Checkers are called as ``checker(prompt, options, ctx=ctx)`` where *ctx*
+    is the shared :class:`PromptContext`; checkers without a ``ctx``
+    parameter, written against the older ``checker(prompt, options)``
+    signature, are called without it.
+
+    ``default_options`` is stored as a read-only mapping so it can be handed
+    to checkers without copying.
+
+    ``trigger_options`` names phrase-list options (e.g. ``"phrases"``) that
+    must *each* have at least one phrase present in the prompt for the rule
+    to be able to fire. When the shared phrase scan shows otherwise, the
+    checker is not called at all.
+
+    ``min_length`` is the shortest prompt (in characters) the rule can fire
+    on; shorter prompts skip the checker.
+
+    ``version`` should be bumped whenever the checker's behaviour changes, so
+    results cached for the old behaviour are not reused. Rules whose checker
+    depends on anything besides the prompt and options (external state,
+    randomness) should set ``cacheable=False`` so their results are never
+    memoised.
+
+    Rules are frozen, because :func:`lint_prompt` caches results per rule
+    object; use :func:`dataclasses.replace` to derive a modified rule.
+
+    ``compiler`` optionally specialises the checker for one options mapping:
+    it is called once per distinct options and returns a
+    ``(prompt, ctx) -> issues`` function with the options already resolved.
+    A compiler that takes a ``severity`` argument is also given the rule's
+    effective severity, so it can build issues with it directly.
     """
 
     id: str
@@ -22,6 +115,151 @@ class Rule:
     checker: CheckerFn
     default_options: Mapping[str, Any] = field(default_factory=dict)
     tags: Set[str] = field(default_factory=set)
+    trigger_options: Tuple[str, ...] = ()
+    compiler: Optional[CompilerFn] = None
+    version: int = 1
+    min_length: int = 0
+    cacheable: bool = True
+    _takes_context: bool = field(default=False, init=False, repr=False, compare=False)
+    _compiler_takes_severity: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+    # ``(overrides, merged)`` for the last config overrides seen by ``merged_options``.
+    _merged: Optional[Tuple[Mapping[str, Any], Mapping[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # ``(options, severity, prepared)`` for the last arguments seen by ``prepare``.
+    _prepared: Optional[Tuple[Mapping[str, Any], Optional[Severity], PreparedRule]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Rule ids are hashed and compared constantly (config lookups, issue
+        # stamping); interning lets those hit the identity fast path.
+        setattr_ = object.__setattr__
+        setattr_(self, "id", sys.intern(self.id))
+        setattr_(self, "default_options", MappingProxyType(dict(self.default_options)))
+        setattr_(self, "_takes_context", _accepts_context(self.checker))
+        setattr_(self, "_compiler_takes_severity", _accepts_severity(self.compiler))
+
+    def __reduce__(self):
+        # ``MappingProxyType`` and the option caches cannot be pickled, so
+        # rebuild the rule from its public fields (e.g. for ``lint_prompts``
+        # worker processes).
+        return (
+            self.__class__,
+            (
+                self.id,
+                self.description,
+                self.default_severity,
+                self.checker,
+                dict(self.default_options),
+                self.tags,
+                self.trigger_options,
+                self.compiler,
+                self.version,
+                self.min_length,
+                self.cacheable,
+            ),
+        )
+
+    def merged_options(self, overrides: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Return ``default_options`` updated with config *overrides*.
+
+        Without overrides this is ``default_options`` itself. Otherwise the
+        merged mapping is cached for the last *overrides* object seen, so
+        linting repeatedly with the same config allocates no option dicts.
+        """
+        if not overrides:
+            return self.default_options
+        cached = self._merged
+        if cached is not None and cached[0] is overrides:
+            return cached[1]
+        merged = MappingProxyType({**self.default_options, **overrides})
+        object.__setattr__(self, "_merged", (overrides, merged))
+        return merged
+
+    def prepare(
+        self,
+        options: Mapping[str, Any],
+        severity: Optional[Severity] = None,
+    ) -> PreparedRule:
+        """Resolve everything the rule needs for fixed *options*, once.
+
+        This builds the compiled checker (via ``compiler`` when set, otherwise
+        by binding *options* to ``check``) and collects the rule's literal
+        phrases and trigger groups. *severity*, the effective severity, is
+        passed on to compilers that accept it. The result is cached for the
+        last *options* object and *severity* seen, which
+        :meth:`merged_options` keeps stable across calls with the same config,
+        so none of this is redone per prompt.
+        """
+        cached = self._prepared
+        if cached is not None and cached[0] is options and cached[1] is severity:
+            return cached[2]
+
+        if self.compiler is not None:
+            if self._compiler_takes_severity and severity is not None:
+                compiled = self.compiler(options, severity=severity)
+            else:
+                compiled = self.compiler(options)
+        else:
+
+            def compiled(prompt: str, ctx: Optional[PromptContext] = None) -> Sequence[LintIssue]:
+                return self.check(prompt, options, ctx)
+
+        cache_key: Optional[Hashable] = None
+        if self.cacheable:
+            cache_key = self._cache_key(options, severity)
+
+        prepared = PreparedRule(
+            check=compiled,
+            # Trigger groups may use keys of their own; index those phrases
+            # too, or the trigger masks would always be empty.
+            phrases=collect_phrases(
+                options, tuple(dict.fromkeys(PHRASE_OPTION_KEYS + self.trigger_options))
+            ),
+            triggers=tuple(collect_phrases(options, (key,)) for key in self.trigger_options),
+            cache_key=cache_key,
+        )
+        object.__setattr__(self, "_prepared", (options, severity, prepared))
+        return prepared
+
+    def _cache_key(
+        self,
+        options: Mapping[str, Any],
+        severity: Optional[Severity],
+    ) -> Optional[Hashable]:
+        """Return the key results for *options* are cached under, or ``None``."""
+        try:
+            cache_key = (
+                self.id,
+                self.version,
+                self.checker,
+                self.compiler,
+                severity,
+                freeze_options(options),
+            )
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def compile(self, options: Mapping[str, Any]) -> CompiledChecker:
+        """Return a ``(prompt, ctx) -> issues`` function for fixed *options*."""
+        return self.prepare(options).check
+
+    def check(
+        self,
+        prompt: str,
+        options: Mapping[str, Any],
+        ctx: Optional[PromptContext] = None,
+    ) -> Sequence[LintIssue]:
+        """Run the checker, passing *ctx* only if the checker accepts it."""
+        checker: Callable[..., Sequence[LintIssue]] = self.checker
+        if self._takes_context:
+            return checker(prompt, options, ctx=ctx)
+        return checker(prompt, options)
 
 
 def wrap_simple_rule(
@@ -38,8 +276,8 @@ def wrap_simple_rule(
     """
     rid = rule_id or getattr(fn, "__name__", "custom-rule")
 
-    def checker(prompt: str, options):
-        # ``options`` are ignored for legacy rules
+    def checker(prompt: str, options, ctx=None):
+        # ``options`` and ``ctx`` are ignored for legacy rules
         return fn(prompt)
 
     return Rule(
@@ -1,5 +1,3 @@
-from __future__ import annotations
-
 """Compatibility module exposing the built‑in rule set.
 
 Older versions of :mod:`prompt_lint` exposed ``ALL_RULES`` as a list of
@@ -15,6 +13,10 @@ so existing code like::
 continues to work.
 """
 
+from __future__ import annotations
+
 from .builtin_rules import BUILTIN_RULES
 
-ALL_RULES = BUILTIN_RULES
+# A list (of the shared built-in rule objects) so that the documented
+# ``ALL_RULES + [my_rule]`` keeps working.
+ALL_RULES = list(BUILTIN_RULES)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import metadata
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 from .rule_types import Rule
 from .builtin_rules import BUILTIN_RULES
@@ -56,3 +57,15 @@ def load_plugin_rules() -> List[Rule]:
 def get_all_rules() -> List[Rule]:
     """Return built‑in rules plus any plugin rules."""
     return load_builtin_rules() + load_plugin_rules()
+
+
+@lru_cache(maxsize=None)
+def get_default_rules() -> Tuple[Rule, ...]:
+    """Return built‑in plus plugin rules, discovered once per process.
+
+    This is what :func:`prompt_lint.core.lint_prompt` uses when no rules are
+    given. Reusing the same rule objects avoids a metadata scan per call and
+    lets results be cached per rule; call ``get_default_rules.cache_clear()``
+    to pick up plugins installed after the first lint.
+    """
+    return tuple(get_all_rules())
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from prompt_lint import lint_prompt
+from prompt_lint import (
+    LintIssue,
+    Rule,
+    Severity,
+    lint_prompt,
+    lint_prompt_iter,
+    lint_prompts,
+    lint_prompts_iter,
+)
+from prompt_lint.models import PromptContext
+from prompt_lint.rules import ALL_RULES
 
 
 def test_conflicting_length_and_unbounded():
@@ -35,3 +45,160 @@ def test_clean_prompt_has_few_or_no_issues():
     assert "conflicting-length" not in rule_ids
     assert "unbounded-length" not in rule_ids
     assert "no-format-specified" not in rule_ids
+
+
+def test_two_argument_checker_rule_still_supported():
+    def checker(prompt, options):
+        if "TODO" in prompt:
+            return [LintIssue(rule_id="contains-todo", message="TODO found")]
+        return []
+
+    rule = Rule(
+        id="contains-todo",
+        description="Flags TODO markers.",
+        default_severity=Severity.ERROR,
+        checker=checker,
+    )
+
+    issues = lint_prompt("TODO: fill in", rules=[rule], load_config_from_disk=False)
+    assert [(i.rule_id, i.severity) for i in issues] == [("contains-todo", Severity.ERROR)]
+
+
+def test_checker_with_optional_third_argument_is_not_given_context():
+    def checker(prompt, options, strict=False):
+        assert strict is False
+        return [LintIssue(rule_id="strict", message="hit")]
+
+    rule = Rule(
+        id="strict",
+        description="Has its own optional argument.",
+        default_severity=Severity.INFO,
+        checker=checker,
+    )
+
+    issues = lint_prompt("Anything.", rules=[rule], load_config_from_disk=False)
+    assert [i.rule_id for i in issues] == ["strict"]
+
+
+def test_checker_skipped_unless_every_trigger_group_matches():
+    seen = []
+
+    def checker(prompt, options, ctx=None):
+        seen.append(prompt)
+        return [LintIssue(rule_id="pair", message="both present")]
+
+    rule = Rule(
+        id="pair",
+        description="Flags prompts mentioning both groups.",
+        default_severity=Severity.WARNING,
+        checker=checker,
+        default_options={"group_a": ["Brief"], "group_b": ["detailed"]},
+        trigger_options=("group_a", "group_b"),
+    )
+
+    for prompt in ("Be brief.", "Be detailed.", "Nothing here.", "BRIEF yet detailed"):
+        lint_prompt(prompt, rules=[rule], load_config_from_disk=False)
+    assert seen == ["BRIEF yet detailed"]
+
+
+def test_trigger_options_may_use_custom_keys():
+    def checker(prompt, options, ctx=None):
+        return [LintIssue(rule_id="keywords", message="hit")]
+
+    rule = Rule(
+        id="keywords",
+        description="Fires when a keyword is present.",
+        default_severity=Severity.INFO,
+        checker=checker,
+        default_options={"keywords": ["foo"]},
+        trigger_options=("keywords",),
+    )
+
+    def rule_ids(prompt):
+        return [i.rule_id for i in lint_prompt(prompt, rules=[rule], load_config_from_disk=False)]
+
+    assert rule_ids("foo bar") == ["keywords"]
+    assert rule_ids("bar baz") == []
+
+
+def test_lint_prompts_matches_lint_prompt():
+    prompts = [
+        "Write a very brief but extremely detailed report.",
+        "Explain how transformers work in machine learning.",
+        "You are an expert. Give me a JSON list of three colours.",
+    ]
+    expected = [lint_prompt(p, load_config_from_disk=False) for p in prompts]
+
+    assert lint_prompts(prompts, load_config_from_disk=False) == expected
+    assert lint_prompts(prompts, load_config_from_disk=False, jobs=2) == expected
+    assert lint_prompts(prompts, ALL_RULES, load_config_from_disk=False, jobs=2) == expected
+    assert list(lint_prompts_iter(iter(prompts), load_config_from_disk=False)) == expected
+    assert list(lint_prompt_iter(prompts[0], load_config_from_disk=False)) == expected[0]
+
+
+def test_lint_prompts_thread_shards_match_serial(monkeypatch):
+    import prompt_lint.core
+
+    # Exercise the free-threaded code path regardless of the interpreter.
+    monkeypatch.setattr(prompt_lint.core, "_threads_run_in_parallel", lambda: True)
+    prompts = [f"Write a brief but detailed note #{i}." for i in range(10)]
+    expected = [lint_prompt(p, load_config_from_disk=False) for p in prompts]
+    assert lint_prompts(prompts, load_config_from_disk=False, jobs=3) == expected
+
+
+def test_lint_prompt_iter_stops_running_rules_early():
+    calls = []
+
+    def make_rule(rule_id):
+        def checker(prompt, options, ctx=None):
+            calls.append(rule_id)
+            return [LintIssue(rule_id=rule_id, message="hit")]
+
+        return Rule(
+            id=rule_id,
+            description="Always fires.",
+            default_severity=Severity.ERROR,
+            checker=checker,
+        )
+
+    rules = [make_rule("first"), make_rule("second")]
+    issues = lint_prompt_iter("Anything.", rules=rules, load_config_from_disk=False)
+    assert any(i.severity is Severity.ERROR for i in issues)
+    assert calls == ["first"]
+
+
+def test_missing_role_detects_role_anywhere_in_prompt():
+    def rule_ids(prompt):
+        return {i.rule_id for i in lint_prompt(prompt, load_config_from_disk=False)}
+
+    assert "missing-role" in rule_ids("Write a haiku about autumn.")
+    assert "missing-role" not in rule_ids("Write a haiku about autumn. You are a poet.")
+    assert "missing-role" not in rule_ids("Hello there.")
+
+
+def test_task_and_role_patterns_ignore_case_on_non_ascii_prompts():
+    # ``str.lower`` and regex case folding disagree on "İ" and "ſ"; matching
+    # follows re.IGNORECASE on the original prompt, as it always has.
+    def rule_ids(prompt):
+        return {i.rule_id for i in lint_prompt(prompt, load_config_from_disk=False)}
+
+    assert "missing-role" in rule_ids("WRİTE")
+    assert "missing-role" in rule_ids("ſummarize it")
+    assert "missing-role" not in rule_ids("İlist things")
+    assert "multiple-tasks" in rule_ids("WRİTE this, ſummarize it and also list")
+    assert "multiple-tasks" in rule_ids("write this, ALſO that, ALſO more")
+
+
+def test_prompt_context_derived_fields():
+    ctx = PromptContext("Write  a\nPoem")
+    assert ctx.text_lower == "write  a\npoem"
+    assert ctx.tokens == ("write", "a", "poem")
+    assert ctx.length_chars == 13
+    assert len(ctx.tokens) == 3
+    # Every whitespace character counts as a separator, so the double space
+    # counts twice.
+    assert ctx.length_words == 4
+    assert PromptContext("three short words").length_words == 3
+    assert PromptContext("a\nb\nc").length_words == 3
+    assert PromptContext("a\tb").length_words == 2
+    assert PromptContext("").length_words == 0
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from prompt_lint.cli import main
+from prompt_lint.core import lint_prompt
+
+CONFLICTING = "Write a very brief but extremely detailed report."
+
+
+@pytest.fixture
+def prompt_dir(tmp_path):
+    (tmp_path / "a.txt").write_text(CONFLICTING, encoding="utf8")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "b.md").write_text("You are a poet. Give me a JSON list.", encoding="utf8")
+    (tmp_path / "ignored.py").write_text(CONFLICTING, encoding="utf8")
+    return tmp_path
+
+
+def test_recursive_lints_prompt_files(prompt_dir, capsys):
+    assert main(["--recursive", str(prompt_dir), "--no-config"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert f"{prompt_dir / 'a.txt'}: [WARNING] conflicting-length" in "\n".join(lines)
+    assert all(line.startswith(str(prompt_dir / "a.txt")) for line in lines)
+
+
+def test_recursive_jobs_matches_serial_json(prompt_dir, capsys):
+    assert main(["--recursive", str(prompt_dir), "--no-config", "--json"]) == 0
+    serial = json.loads(capsys.readouterr().out)
+    assert main(["--recursive", str(prompt_dir), "--no-config", "--json", "--jobs", "2"]) == 0
+    assert json.loads(capsys.readouterr().out) == serial
+    assert {record["file"] for record in serial} == {str(prompt_dir / "a.txt")}
+
+
+def test_streamed_json_matches_json_dump(tmp_path, capsys):
+    path = tmp_path / "prompt.txt"
+    path.write_text(CONFLICTING, encoding="utf8")
+    expected = [i.as_dict() for i in lint_prompt(CONFLICTING, load_config_from_disk=False)]
+
+    assert main(["--file", str(path), "--no-config", "--json"]) == 0
+    assert capsys.readouterr().out == json.dumps(expected, indent=2) + "\n"
+
+    path.write_text("You are a poet. Give me a JSON list.", encoding="utf8")
+    assert main(["--file", str(path), "--no-config", "--json"]) == 0
+    assert capsys.readouterr().out == "[]\n"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--recursive", "/nonexistent/prompts"],
+        ["--file", "prompt.txt", "--jobs", "2"],
+        ["--recursive", ".", "--jobs", "0"],
+    ],
+)
+def test_invalid_arguments_are_rejected(argv, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main(argv)
+    assert exc_info.value.code == 2
+    assert "error:" in capsys.readouterr().err
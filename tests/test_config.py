@@ -1,7 +1,15 @@
 from __future__ import annotations
 
-from prompt_lint import lint_prompt
-from prompt_lint.config import LintConfig, RuleOptions
+import dataclasses
+import os
+import sys
+import threading
+
+import pytest
+
+from prompt_lint import LintIssue, Rule, lint_prompt, lint_prompts
+from prompt_lint._rule_cache import RuleCache
+from prompt_lint.config import LintConfig, RuleOptions, clear_config_cache, load_config
 from prompt_lint.models import Severity
 from prompt_lint.rules import ALL_RULES
 
@@ -53,3 +61,221 @@ def test_config_can_disable_rule_and_override_severity():
     }
     assert unbounded_severities == {Severity.ERROR}
 
+
+def test_config_phrase_override_is_used():
+    prompt = "Tell me everything you know, leave nothing out."
+
+    config = LintConfig(
+        rules={
+            "unbounded-length": RuleOptions(
+                options={"phrases": ["leave nothing out"]},
+            ),
+        }
+    )
+
+    issues = lint_prompt(prompt, config=config, load_config_from_disk=False)
+    unbounded = [issue for issue in issues if issue.rule_id == "unbounded-length"]
+    assert len(unbounded) == 1
+    assert unbounded[0].data == {"phrases": ["leave nothing out"]}
+
+
+def test_load_config_is_cached_until_file_changes(tmp_path, monkeypatch):
+    cfg_file = tmp_path / "prompt-lint.toml"
+    cfg_file.write_text('[rules.missing-role]\nenabled = false\n', encoding="utf8")
+    monkeypatch.chdir(tmp_path)
+    clear_config_cache()
+
+    first = load_config()
+    assert first is load_config()
+    assert first.get_rule_options("missing-role").enabled is False
+
+    cfg_file.write_text('[rules.missing-role]\nenabled = true\n', encoding="utf8")
+    stat = cfg_file.stat()
+    os.utime(cfg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_config()
+    assert second is not first
+    assert second.get_rule_options("missing-role").enabled is True
+
+    cfg_file.unlink()
+    assert load_config().rules == {}
+
+
+def test_load_config_finds_config_created_after_a_miss(tmp_path, monkeypatch):
+    (tmp_path / "sub").mkdir()
+    monkeypatch.chdir(tmp_path / "sub")
+    clear_config_cache()
+    assert load_config().rules == {}
+
+    (tmp_path / "prompt-lint.toml").write_text(
+        '[rules.missing-role]\nenabled = false\n', encoding="utf8"
+    )
+    assert load_config().get_rule_options("missing-role").enabled is False
+
+    # A config nearer the working directory takes over from the parent's.
+    (tmp_path / "sub" / "prompt-lint.toml").write_text(
+        '[rules.missing-role]\nseverity = "error"\n', encoding="utf8"
+    )
+    options = load_config().get_rule_options("missing-role")
+    assert (options.enabled, options.severity) == (True, Severity.ERROR)
+
+
+def test_lint_prompt_memoises_per_config_contents():
+    prompt = "Write a very brief but extremely detailed report."
+
+    def config(enabled):
+        return LintConfig(rules={"conflicting-length": RuleOptions(enabled=enabled)})
+
+    first = lint_prompt(prompt, config=config(True), load_config_from_disk=False)
+    again = lint_prompt(prompt, config=config(True), load_config_from_disk=False)
+    assert again == first
+
+    # Memoised issues are copied, so callers cannot corrupt later results.
+    first[0].message = "edited"
+    first[0].data["group_a"].append("edited")
+    third = lint_prompt(prompt, config=config(True), load_config_from_disk=False)
+    assert third == again
+    assert third[0] is not again[0]
+
+    # Equal-looking configs share results, but a changed config does not.
+    disabled = lint_prompt(prompt, config=config(False), load_config_from_disk=False)
+    assert "conflicting-length" not in {issue.rule_id for issue in disabled}
+
+
+def test_memoised_issues_keep_their_subclass():
+    @dataclasses.dataclass
+    class SpanIssue(LintIssue):
+        start: int = 0
+
+    def checker(prompt, options, ctx=None):
+        return [SpanIssue(rule_id="span", message="hit", data={"n": [1]}, start=2)]
+
+    rule = Rule(
+        id="span",
+        description="Returns a LintIssue subclass.",
+        default_severity=Severity.INFO,
+        checker=checker,
+    )
+
+    for _ in range(2):
+        (issue,) = lint_prompt("prompt", rules=[rule], load_config_from_disk=False)
+        assert type(issue) is SpanIssue
+        assert (issue.start, issue.data) == (2, {"n": [1]})
+        issue.data["n"].append(2)
+
+
+def test_rule_options_accept_plain_string_severity():
+    prompt = "Write a very brief but extremely detailed report."
+    as_string = LintConfig(rules={"conflicting-length": RuleOptions(severity="error")})
+    as_enum = LintConfig(rules={"conflicting-length": RuleOptions(severity=Severity.ERROR)})
+    assert as_string.fingerprint() == as_enum.fingerprint()
+
+    issues = lint_prompt(prompt, config=as_string, load_config_from_disk=False)
+    assert [i.severity for i in issues if i.rule_id == "conflicting-length"] == ["error"]
+
+
+def test_config_change_only_reruns_affected_rules():
+    calls = []
+
+    def make_rule(rule_id):
+        def checker(prompt, options, ctx=None):
+            calls.append(rule_id)
+            return [LintIssue(rule_id=rule_id, message=options.get("message", "hit"))]
+
+        return Rule(
+            id=rule_id,
+            description="Always fires.",
+            default_severity=Severity.INFO,
+            checker=checker,
+        )
+
+    rules = [make_rule("rule-a"), make_rule("rule-b")]
+    prompt = "Some prompt."
+
+    lint_prompt(prompt, rules=rules, load_config_from_disk=False)
+    assert calls == ["rule-a", "rule-b"]
+
+    config = LintConfig(rules={"rule-a": RuleOptions(options={"message": "changed"})})
+    issues = lint_prompt(prompt, rules=rules, config=config, load_config_from_disk=False)
+    assert calls == ["rule-a", "rule-b", "rule-a"]
+    assert [i.message for i in issues] == ["changed", "hit"]
+
+
+def test_rules_are_frozen_so_cached_results_stay_valid():
+    prompt = "Write a very brief but extremely detailed report."
+    rule = next(r for r in ALL_RULES if r.id == "conflicting-length")
+    assert lint_prompt(prompt, rules=[rule], load_config_from_disk=False)[0].severity == "warning"
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        rule.default_severity = Severity.ERROR
+
+    stricter = dataclasses.replace(rule, default_severity=Severity.ERROR)
+    issues = lint_prompt(prompt, rules=[stricter], load_config_from_disk=False)
+    assert [i.severity for i in issues] == ["error"]
+
+
+def test_stateful_rules_can_opt_out_of_caching():
+    counter = iter(range(100))
+
+    def checker(prompt, options, ctx=None):
+        return [LintIssue(rule_id="counter", message=str(next(counter)))]
+
+    def make_rule(**kwargs):
+        return Rule(
+            id="counter",
+            description="Counts calls.",
+            default_severity=Severity.INFO,
+            checker=checker,
+            **kwargs,
+        )
+
+    def lint(rule, **kwargs):
+        return lint_prompt("prompt", rules=[rule], load_config_from_disk=False, **kwargs)
+
+    cached = make_rule()
+    assert [lint(cached)[0].message for _ in range(3)] == ["0", "0", "0"]
+    assert [lint(cached, cache=False)[0].message for _ in range(2)] == ["1", "2"]
+
+    uncached = make_rule(cacheable=False)
+    assert [lint(uncached)[0].message for _ in range(2)] == ["3", "4"]
+
+
+def test_lint_prompts_with_rule_options_in_worker_processes():
+    prompts = [f"Write a very brief but extremely detailed report #{i}." for i in range(4)]
+    config = LintConfig(
+        rules={
+            "conflicting-length": RuleOptions(enabled=False),
+            "no-format-specified": RuleOptions(severity=Severity.ERROR),
+        }
+    )
+    expected = [lint_prompt(p, config=config) for p in prompts]
+    assert lint_prompts(prompts, config=config, jobs=2) == expected
+
+
+def test_rule_cache_is_thread_safe():
+    cache = RuleCache(maxsize=2)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(50000):
+                key = (n + i) % 5
+                if cache.get(b"prompt", key) is None:
+                    cache.set(b"prompt", key, ())
+        except Exception as exc:  # pragma: no cover - only on regression
+            errors.append(exc)
+
+    # Switch threads as often as possible to provoke interleaved evictions.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(cache) <= 2
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from prompt_lint import lint_prompt, lint_prompt_iter
+from prompt_lint._scanner import BACKENDS, PhraseIndex, available_backends
+
+PHRASES = ["brief", "brief report", "detailed", "as much as you can", "naïve", ""]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    if request.param not in available_backends():
+        pytest.skip(f"{request.param} is not installed")
+    return request.param
+
+
+def test_scan_finds_phrases_and_masks(backend):
+    index = PhraseIndex(PHRASES, backend=backend)
+    found, mask = index.scan("a brief report, naïve and as much as you can brief")
+    assert found == {"", "brief", "brief report", "naïve", "as much as you can"}
+    assert mask == index.mask(found)
+    assert not mask & index.mask(["detailed"])
+
+
+def test_scan_without_matches(backend):
+    index = PhraseIndex(["brief", "detailed"], backend=backend)
+    assert index.scan("nothing to see here") == (frozenset(), 0)
+
+
+def test_scan_handles_lone_surrogates(backend):
+    index = PhraseIndex(["brief", "detailed", "\udcff"], backend=backend)
+    found, _ = index.scan("write a brief \udcff but detailed")
+    assert found == {"brief", "detailed", "\udcff"}
+
+
+def test_lint_prompt_with_lone_surrogate():
+    issues = lint_prompt("write a brief \udcff but detailed", load_config_from_disk=False)
+    assert "conflicting-length" in {i.rule_id for i in issues}
+
+
+def test_scan_is_thread_safe(backend):
+    index = PhraseIndex(PHRASES, backend=backend)
+    text = "write a brief but detailed report. " * 5000
+    expected = index.scan(text)
+    results, errors = [], []
+
+    def worker():
+        try:
+            for _ in range(10):
+                results.append(index.scan(text))
+        except Exception as exc:  # pragma: no cover - only on regression
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert results == [expected] * 80
+
+
+def test_lint_prompt_iter_from_many_threads():
+    prompt = "Write a very brief but extremely detailed report. " * 2000
+    expected = [i.rule_id for i in lint_prompt_iter(prompt, load_config_from_disk=False)]
+    results, errors = [], []
+
+    def worker():
+        try:
+            for _ in range(5):
+                issues = lint_prompt_iter(prompt, load_config_from_disk=False)
+                results.append([i.rule_id for i in issues])
+        except Exception as exc:  # pragma: no cover - only on regression
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert results == [expected] * 40